@@ -50,6 +50,7 @@ from app.middleware import get_token_detail
 from app.analytics.api.dependencies import (AnalyticsHandlerDep, DashboardHandlerDep,
                                             DashboardCollaborationHandlerDep, ChartServiceDep, ChartQueueServiceDep)
 from app.analytics.service.chart_queue_service import ChartQueueService
+from app.analytics.constants import EXCEL_MIME_TYPES, EXCEL_EXTENSIONS
 
 from app.analytics.errors import (
     ChartNotFoundError,
@@ -131,17 +132,10 @@ async def create_excel_database(
     """Create a new Excel database from uploaded file"""
     try:
         # Validate file is Excel format
-        valid_excel_mime_types = [
-            "application/vnd.ms-excel",  # .xls
-            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",  # .xlsx
-            "application/vnd.ms-excel.sheet.macroEnabled.12"  # .xlsm
-        ]
-        
-        # Check content type
-        if excel_file.content_type not in valid_excel_mime_types:
+        if excel_file.content_type not in EXCEL_MIME_TYPES:
             # Also check filename extension as fallback
             filename = excel_file.filename
-            if filename is None or not (filename.lower().endswith('.xlsx') or filename.lower().endswith('.xls') or filename.lower().endswith('.xlsm')):
+            if filename is None or not filename.lower().endswith(EXCEL_EXTENSIONS):
                 raise HTTPException(
                     status_code=400, 
                     detail="Invalid file format. Only Excel files (.xlsx, .xls, .xlsm) are accepted."
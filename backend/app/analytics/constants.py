@@ -0,0 +1,7 @@
+# Accepted Excel uploads, shared by the upload route and SchemaService
+EXCEL_MIME_TYPES = frozenset({
+    "application/vnd.ms-excel",  # .xls
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",  # .xlsx
+    "application/vnd.ms-excel.sheet.macroEnabled.12"  # .xlsm
+})
+EXCEL_EXTENSIONS = ('.xlsx', '.xls', '.xlsm')
@@ -1,5 +1,7 @@
 import json
 import logging
+import threading
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import uuid
@@ -45,37 +47,58 @@ def parse_datetime(date_string: str) -> datetime:
         return datetime.now()
 
 
+# Value -> member lookups, built once instead of per converted row
+_CHART_TYPES = ChartType._value2member_map_
+_CHART_VISIBILITIES = ChartVisibility._value2member_map_
+
+
+@lru_cache(maxsize=65536)
+def _uuid(value: str) -> uuid.UUID:
+    """Parse a UUID string, memoised since rows for one message share the same ID."""
+    return uuid.UUID(hex=value)
+
+
 class ChartRepository:
     """Repository for chart-related operations"""
 
+    # Shared across instances so the index DDL runs once per process
+    _indexes_initialized: bool = False
+    _index_init_lock = threading.Lock()
+
     def __init__(self, db_conn: Neo4jConnection = None, logger=None):
         """Initialize the chart repository"""
         self.db_conn = db_conn
         self.logger = logger or logging.getLogger(__name__)
         # Initialize indexes if they don't exist (will be ignored if already exist)
-        self._ensure_indexes()
+        if not ChartRepository._indexes_initialized:
+            self._ensure_indexes()
     
     def _ensure_indexes(self):
         """Ensure required indexes exist for efficient queries"""
-        try:
-            # Use Neo4j index syntax with IF NOT EXISTS to prevent errors with existing indexes
-            self._execute_query("CREATE INDEX IF NOT EXISTS FOR (c:Chart) ON (c.visibility)")
-            self._execute_query("CREATE INDEX IF NOT EXISTS FOR (c:Chart) ON (c.created_by)")
-            self._execute_query("CREATE INDEX IF NOT EXISTS FOR (c:Chart) ON (c.org_id)")
-            self._execute_query("CREATE INDEX IF NOT EXISTS FOR (c:Chart) ON (c.message_id)")
-            
-            self.logger.info("Chart indexes verified")
-        except Exception as e:
-            # Log but don't fail - indexes are for optimization only
-            self.logger.warning(f"Could not create indexes: {e}")
+        with ChartRepository._index_init_lock:
+            if ChartRepository._indexes_initialized:
+                return
+            try:
+                # Use Neo4j index syntax with IF NOT EXISTS to prevent errors with existing indexes
+                self._execute_query("CREATE INDEX IF NOT EXISTS FOR (c:Chart) ON (c.visibility)")
+                self._execute_query("CREATE INDEX IF NOT EXISTS FOR (c:Chart) ON (c.created_by)")
+                self._execute_query("CREATE INDEX IF NOT EXISTS FOR (c:Chart) ON (c.org_id)")
+                self._execute_query("CREATE INDEX IF NOT EXISTS FOR (c:Chart) ON (c.message_id)")
+                
+                ChartRepository._indexes_initialized = True
+                self.logger.info("Chart indexes verified")
+            except Exception as e:
+                # Log but don't fail - indexes are for optimization only
+                self.logger.warning(f"Could not create indexes: {e}")
     
     def _execute_query(self, query, params=None, transaction=False):
         """Execute a Cypher query using the connection pool"""
         try:
-            # Log query for debugging (trimmed for large queries)
+            # Log query for debugging (trimmed for large queries). Params are not
+            # logged here: they can carry whole chart payloads, and str() would
+            # render them in full before trimming
             query_log = query[:500] + '...' if len(query) > 500 else query
             self.logger.debug(f"Executing query: {query_log}")
-            self.logger.debug(f"Params: {str(params)[:200]}...")
             
             # Use self.db_conn if available, otherwise fallback to direct db usage
             if self.db_conn:
@@ -158,8 +181,7 @@ class ChartRepository:
                 chart_schema['$schema'] = "https://vega.github.io/schema/vega-lite/v5.json"
                 
             # Validate chart_type is a valid enum value
-            valid_chart_types = [chart_type.value for chart_type in ChartType]
-            if chart_type not in valid_chart_types:
+            if chart_type not in _CHART_TYPES:
                 if chart_type == 'arc':
                     self.logger.info(f"Converting 'arc' chart_type to 'pie'")
                     chart_type = "pie"
@@ -169,13 +191,10 @@ class ChartRepository:
             
             # Make sure all nested objects in chart schema are serialized
             try:
-                # Deep copy to avoid mutation issues
-                chart_schema_copy = json.loads(json.dumps(chart_schema))
-                chart_data_copy = json.loads(json.dumps(chart_data))
-                
-                # Convert complex objects to JSON strings
-                chart_schema_str = json.dumps(chart_schema_copy)
-                chart_data_str = json.dumps(chart_data_copy)
+                # Serialize directly - the resulting strings are already detached
+                # copies, so a json round-trip beforehand only doubles the work
+                chart_schema_str = json.dumps(chart_schema)
+                chart_data_str = json.dumps(chart_data)
                 
                 # Convert field mappings to JSON string if provided
                 field_mappings_str = json.dumps(available_adjustments) if available_adjustments else None
@@ -302,10 +321,10 @@ class ChartRepository:
             props = {}
             
             # Handle both types of Neo4j node objects (neo4j-driver and py2neo)
-            if hasattr(node, 'items'):
+            node_items = getattr(node, 'items', None)
+            if node_items is not None:
                 # For neo4j-driver Node object
-                for key, value in dict(node).items():
-                    props[key] = value
+                props = dict(node_items())
             else:
                 # For py2neo Node object
                 for key in dir(node):
@@ -324,25 +343,27 @@ class ChartRepository:
             
             # Parse chart data JSON
             chart_data = []
-            if 'chart_data' in props and props['chart_data']:
+            raw_chart_data = props.get('chart_data')
+            if raw_chart_data:
                 try:
-                    if isinstance(props['chart_data'], str):
-                        chart_data = json.loads(props['chart_data'])
-                    elif isinstance(props['chart_data'], list):
-                        chart_data = props['chart_data']
+                    if isinstance(raw_chart_data, str):
+                        chart_data = json.loads(raw_chart_data)
+                    elif isinstance(raw_chart_data, list):
+                        chart_data = raw_chart_data
                 except json.JSONDecodeError:
-                    self.logger.error(f"Failed to parse chart data JSON: {props['chart_data']}")
+                    self.logger.error(f"Failed to parse chart data JSON: {raw_chart_data}")
             
             # Parse chart schema JSON
             chart_schema = {}
-            if 'chart_schema' in props and props['chart_schema']:
+            raw_chart_schema = props.get('chart_schema')
+            if raw_chart_schema:
                 try:
-                    if isinstance(props['chart_schema'], str):
-                        chart_schema = json.loads(props['chart_schema'])
-                    elif isinstance(props['chart_schema'], dict):
-                        chart_schema = props['chart_schema']
+                    if isinstance(raw_chart_schema, str):
+                        chart_schema = json.loads(raw_chart_schema)
+                    elif isinstance(raw_chart_schema, dict):
+                        chart_schema = raw_chart_schema
                 except json.JSONDecodeError:
-                    self.logger.error(f"Failed to parse chart schema JSON: {props['chart_schema']}")
+                    self.logger.error(f"Failed to parse chart schema JSON: {raw_chart_schema}")
             
             # Parse field mappings JSON if available
             field_mappings = None
@@ -351,14 +372,15 @@ class ChartRepository:
             alternative_visualizations = None
             # Parse alternative visualization queries if available
             alternative_visualization_queries = None
-            if 'alternative_visualization_queries' in props and props['alternative_visualization_queries']:
+            raw_alternative_visualization_queries = props.get('alternative_visualization_queries')
+            if raw_alternative_visualization_queries:
                 try:
-                    if isinstance(props['alternative_visualization_queries'], str):
-                        alternative_visualization_queries = json.loads(props['alternative_visualization_queries'])
-                    elif isinstance(props['alternative_visualization_queries'], list):
-                        alternative_visualization_queries = props['alternative_visualization_queries']
+                    if isinstance(raw_alternative_visualization_queries, str):
+                        alternative_visualization_queries = json.loads(raw_alternative_visualization_queries)
+                    elif isinstance(raw_alternative_visualization_queries, list):
+                        alternative_visualization_queries = raw_alternative_visualization_queries
                 except json.JSONDecodeError:
-                    self.logger.error(f"Failed to parse alternative_visualization_queries JSON: {props['alternative_visualization_queries']}")
+                    self.logger.error(f"Failed to parse alternative_visualization_queries JSON: {raw_alternative_visualization_queries}")
                     alternative_visualization_queries = None
             
             # Get message ID from node properties
@@ -373,16 +395,14 @@ class ChartRepository:
             chart_type = ChartType.BAR  # Default
             
             # First check the explicit chart_type property
-            if 'chart_type' in props and props['chart_type']:
-                type_str = props['chart_type']
-                if isinstance(type_str, str) and type_str in [t.value for t in ChartType]:
-                    chart_type = ChartType(type_str)
-                    self.logger.info(f"Using chart_type from props: {chart_type}")
+            type_str = props.get('chart_type')
+            if type_str:
+                if isinstance(type_str, str) and type_str in _CHART_TYPES:
+                    chart_type = _CHART_TYPES[type_str]
             elif 'chart_type' in chart_schema:
                 type_str = chart_schema['chart_type']
-                if isinstance(type_str, str) and type_str in [t.value for t in ChartType]:
-                    chart_type = ChartType(type_str)
-                    self.logger.info(f"Using chart_type from chart_schema: {chart_type}")
+                if isinstance(type_str, str) and type_str in _CHART_TYPES:
+                    chart_type = _CHART_TYPES[type_str]
             
             # But also check the schema for special encodings and mark types
             if chart_schema:
@@ -399,87 +419,34 @@ class ChartRepository:
                     # Map non-standard mark types to chart types
                     if mark_type == 'arc':
                         chart_type = ChartType.PIE
-                        self.logger.info(f"Mapped 'arc' mark type to pie chart type")
-                    elif mark_type in [t.value for t in ChartType]:
-                        chart_type = ChartType(mark_type)
-                        self.logger.info(f"Using chart_type from mark: {chart_type}")
+                    elif mark_type in _CHART_TYPES:
+                        chart_type = _CHART_TYPES[mark_type]
                 
                 # Then check encoding properties
                 if 'encoding' in chart_schema:
                     # For grouped_bar charts: check if xOffset exists in encoding
                     if 'xOffset' in chart_schema['encoding'] and chart_type == ChartType.BAR:
                         chart_type = ChartType.GROUPED_BAR
-                        self.logger.info(f"Detected grouped_bar chart based on xOffset encoding")
                     
                     # For stacked_bar charts: check if y contains 'stack' property
                     elif 'y' in chart_schema['encoding'] and 'stack' in chart_schema['encoding']['y'] and chart_type == ChartType.BAR:
                         chart_type = ChartType.STACKED_BAR
-                        self.logger.info(f"Detected stacked_bar chart based on y.stack encoding")
                         
                     # For pie charts: check for theta encoding
                     elif 'theta' in chart_schema['encoding'] and chart_type not in [ChartType.PIE]:
                         chart_type = ChartType.PIE
-                        self.logger.info(f"Detected pie chart based on theta encoding")
             
             # Parse dates
-            created_at = datetime.now()
-            updated_at = datetime.now()
-            last_refreshed_at = datetime.now()
-            
-            if 'created_at' in props and props['created_at']:
-                try:
-                    if isinstance(props['created_at'], str):
-                        created_at = parse_datetime(props['created_at'])
-                    elif hasattr(props['created_at'], 'year'):  # Neo4j DateTime object
-                        created_at = datetime(
-                            props['created_at'].year, 
-                            props['created_at'].month, 
-                            props['created_at'].day,
-                            props['created_at'].hour, 
-                            props['created_at'].minute, 
-                            props['created_at'].second
-                        )
-                except (ValueError, TypeError):
-                    self.logger.error(f"Failed to parse created_at: {props['created_at']}")
-            
-            if 'updated_at' in props and props['updated_at']:
-                try:
-                    if isinstance(props['updated_at'], str):
-                        updated_at = parse_datetime(props['updated_at'])
-                    elif hasattr(props['updated_at'], 'year'):  # Neo4j DateTime object
-                        updated_at = datetime(
-                            props['updated_at'].year, 
-                            props['updated_at'].month, 
-                            props['updated_at'].day,
-                            props['updated_at'].hour, 
-                            props['updated_at'].minute, 
-                            props['updated_at'].second
-                        )
-                except (ValueError, TypeError):
-                    self.logger.error(f"Failed to parse updated_at: {props['updated_at']}")
-            
-            if 'last_refreshed_at' in props and props['last_refreshed_at']:
-                try:
-                    if isinstance(props['last_refreshed_at'], str):
-                        last_refreshed_at = parse_datetime(props['last_refreshed_at'])
-                    elif hasattr(props['last_refreshed_at'], 'year'):  # Neo4j DateTime object
-                        last_refreshed_at = datetime(
-                            props['last_refreshed_at'].year, 
-                            props['last_refreshed_at'].month, 
-                            props['last_refreshed_at'].day,
-                            props['last_refreshed_at'].hour, 
-                            props['last_refreshed_at'].minute, 
-                            props['last_refreshed_at'].second
-                        )
-                except (ValueError, TypeError):
-                    self.logger.error(f"Failed to parse last_refreshed_at: {props['last_refreshed_at']}")
+            created_at = self._node_datetime(props.get('created_at'), 'created_at')
+            updated_at = self._node_datetime(props.get('updated_at'), 'updated_at')
+            last_refreshed_at = self._node_datetime(props.get('last_refreshed_at'), 'last_refreshed_at')
             
             # Parse visibility
             visibility = ChartVisibility.PRIVATE
-            if 'visibility' in props and props['visibility']:
-                vis_str = props['visibility']
-                if isinstance(vis_str, str) and vis_str in [v.value for v in ChartVisibility]:
-                    visibility = ChartVisibility(vis_str)
+            vis_str = props.get('visibility')
+            if vis_str:
+                if isinstance(vis_str, str) and vis_str in _CHART_VISIBILITIES:
+                    visibility = _CHART_VISIBILITIES[vis_str]
             
             # Create Chart entity
             chart = Chart(
@@ -489,7 +456,7 @@ class ChartRepository:
                 chart_type=chart_type,
                 chart_schema=chart_schema,
                 chart_data=chart_data,
-                message_id=uuid.UUID(hex=msg_id_from_props),
+                message_id=_uuid(msg_id_from_props) if isinstance(msg_id_from_props, str) else msg_id_from_props,
                 user_id=props.get('user_id', ''),
                 org_id=props.get('org_id'),
                 visibility=visibility,
@@ -499,14 +466,25 @@ class ChartRepository:
                 alternative_visualization_queries=alternative_visualization_queries
             )
             
-            # Log created chart details
-            self.logger.info(f"Created chart entity with ID: {chart.uid}, Type: {chart.chart_type}")
-                
             return chart
             
         except Exception as e:
             self.logger.error(f"Error converting node to Chart: {str(e)}")
             raise
+
+    def _node_datetime(self, value, field: str) -> datetime:
+        """Convert a node datetime property (ISO string or Neo4j DateTime) to a datetime"""
+        if not value:
+            return datetime.now()
+        try:
+            if isinstance(value, str):
+                return parse_datetime(value)
+            year = getattr(value, 'year', None)
+            if year is not None:  # Neo4j DateTime object
+                return datetime(year, value.month, value.day, value.hour, value.minute, value.second)
+        except (ValueError, TypeError):
+            self.logger.error(f"Failed to parse {field}: {value}")
+        return datetime.now()
     
     async def get_chart(self, chart_id: str, user_id: str, org_id: Optional[str] = None) -> Optional[Chart]:
         """
@@ -617,14 +595,13 @@ class ChartRepository:
                 }
             )
             
-            charts = []
-            for result in results:
-                # Handle both list and direct result formats
-                chart_node = result[0] if isinstance(result, list) else result
-                
-                # Convert node to Chart using _node_to_chart
-                chart = self._node_to_chart(chart_node)
-                charts.append(chart)
+            # Handle both list and direct result formats, then convert each node
+            # with a locally bound converter
+            node_to_chart = self._node_to_chart
+            charts = [
+                node_to_chart(result[0] if isinstance(result, list) else result)
+                for result in results
+            ]
                 
             return charts
             
@@ -684,12 +661,14 @@ class ChartRepository:
             
             charts = []
             if chart_results:
+                node_to_chart = self._node_to_chart
+                append = charts.append
                 for record in chart_results:
                     # Result is expected to be a list of records, where each record is the node itself or a list containing the node
                     chart_node = record[0] if isinstance(record, list) and len(record) > 0 else record
-                    chart_entity = self._node_to_chart(chart_node)
+                    chart_entity = node_to_chart(chart_node)
                     if chart_entity:
-                        charts.append(chart_entity)
+                        append(chart_entity)
             
             # Query for total count
             count_query = f"""
@@ -810,13 +789,6 @@ class ChartRepository:
         """
         try:
             now = datetime.utcnow().isoformat()
-            
-            # First serialize all complex objects to JSON
-            try:
-                chart_data_json = json.dumps(chart_data) # This is used for logging/validation, actual param uses original
-            except Exception as e:
-                self.logger.error(f"Error serializing chart data for logging: {str(e)}")
-                # Do not return None here, proceed with original data for query
                 
             # Log available adjustments dict details
             if available_adjustments:
@@ -1,9 +1,11 @@
 """
 Table model for Neo4j database schema representation.
 """
+import json
+import uuid
 from typing import Dict, Any, Optional, List
 from neomodel import (
-    StructuredNode, StringProperty, RelationshipTo, RelationshipFrom,
+    db, StructuredNode, StringProperty, RelationshipTo, RelationshipFrom,
     ZeroOrMore, One, JSONProperty, BooleanProperty, IntegerProperty, UniqueIdProperty
 )
 from app.analytics.repository.schema.models.relationships import ForeignKeyRel, SharedColumnRel
@@ -12,6 +14,11 @@ from pkg.log.logger import get_logger
 # Initialize logger
 logger = get_logger("table_model")
 
+# Max rows per UNWIND statement in bulk_upsert_columns
+COLUMN_UPSERT_BATCH_SIZE = 1000
+# Column properties bulk_upsert_columns refreshes on existing columns when provided
+COLUMN_UPDATABLE_KEYS = ('is_primary_key', 'is_nullable', 'description', 'default')
+
 class Table(StructuredNode):
     """Node representing a database table"""
     uid = UniqueIdProperty()  # Add UID
@@ -86,9 +93,72 @@ class Table(StructuredNode):
             
             # Connect column to this table
             self.columns.connect(column)
-            
+
             return column
 
+    def bulk_upsert_columns(self, columns: List[Dict[str, Any]]) -> int:
+        """
+        Create or update many columns of this table in a single round-trip.
+
+        Uses UNWIND + MERGE on the indexed unique_name, so it matches
+        get_or_create_column: new columns are created and connected to the
+        table, existing ones only get the is_primary_key/is_nullable/
+        description/default keys that were passed refreshed.
+
+        Args:
+            columns: Dicts with name, data_type and optional is_primary_key,
+                is_nullable, description, default and stats keys. stats is
+                only written when the column is created.
+
+        Returns:
+            Number of columns written.
+        """
+        if not columns:
+            return 0
+
+        rows = [
+            {
+                'uid': uuid.uuid4().hex,
+                'name': str(col['name']),
+                'data_type': col['data_type'],
+                'unique_name': f"{self.database_uid}:{self.name}.{col['name']}",
+                'description': col.get('description') or '',
+                'stats': json.dumps(col.get('stats') or {}),
+                'props': {key: col[key] for key in COLUMN_UPDATABLE_KEYS if key in col},
+            }
+            for col in columns
+        ]
+
+        query = """
+        MATCH (t:Table {uid: $table_uid})
+        UNWIND $rows AS r
+        MERGE (c:Column {unique_name: r.unique_name})
+        ON CREATE SET c.uid = r.uid,
+                      c.name = r.name,
+                      c.data_type = r.data_type,
+                      c.description = r.description,
+                      c.database_uid = $database_uid,
+                      c.table_uid = $table_uid,
+                      c.stats = r.stats,
+                      c.is_primary_key = false,
+                      c.is_nullable = true,
+                      c.is_foreign_key = false
+        SET c += r.props
+        MERGE (t)-[:HAS_COLUMN]->(c)
+        RETURN count(c)
+        """
+        # Send rows in fixed-size batches so very wide tables don't build one huge
+        # parameter list / transaction
+        written = 0
+        for start in range(0, len(rows), COLUMN_UPSERT_BATCH_SIZE):
+            results, _ = db.cypher_query(query, {
+                'table_uid': self.uid,
+                'database_uid': self.database_uid,
+                'rows': rows[start:start + COLUMN_UPSERT_BATCH_SIZE],
+            })
+            written += results[0][0] if results else 0
+        return written
+
     def add_foreign_key(self, target_table: 'Table', source_column: str, target_column: str, rel_type: str = 'ONE_TO_MANY'):
         """Add a foreign key relationship to another table"""
         # Validate relationship type
@@ -2,7 +2,7 @@
 Service for handling relationship operations in Neo4j schema.
 """
 from typing import Dict, List, Any, Optional
-from app.analytics.repository.schema.utils import singular_form, plural_form
+from app.analytics.repository.schema.utils import singular_form
 from pkg.log.logger import get_logger
 
 # Initialize logger
@@ -121,9 +121,15 @@ def infer_foreign_key_relationships(database):
                     
         logger.info(f"[FK Inference] Found {len(existing_relations)} existing relationships")
         
+        # Lowercase table names and derive their id-column patterns once instead of per column pair
+        lowered_tables = [
+            (table, table.name.lower(), (f"{singular_form(table.name.lower())}_id", f"{table.name.lower()}_id"))
+            for table in tables
+        ]
+        
         # First pass: Look for direct column name matches
         logger.info("[FK Inference] Starting first pass: direct column name matches")
-        for source_table in tables:
+        for source_table, source_name, _ in lowered_tables:
             source_columns = list(source_table.columns.all())
             
             for source_col in source_columns:
@@ -141,7 +147,7 @@ def infer_foreign_key_relationships(database):
                         target_table = table_dict[prefix]
                         
                         # Skip self-references for now (we'll handle these specially)
-                        if target_table.name.lower() == source_table.name.lower():
+                        if prefix == source_name:
                             logger.info(f"[FK Inference] Found potential self-reference: {source_table.name}.{source_col.name}")
                             continue
                         
@@ -178,7 +184,8 @@ def infer_foreign_key_relationships(database):
         
         # New pass: Check for matching column names between tables (e.g., customer_id in orders matching primary ID in customers)
         logger.info("[FK Inference] Starting additional pass: matching column names across tables")
-        for source_table in tables:
+        pk_table_singulars = {name: singular_form(name) for name in table_pk}
+        for source_table, source_name, _ in lowered_tables:
             source_columns = list(source_table.columns.all())
             
             for source_col in source_columns:
@@ -190,10 +197,11 @@ def infer_foreign_key_relationships(database):
                 if not source_col.name.endswith('_id'):
                     continue
                 
+                prefix = source_col.name[:-3].lower()  # Remove the _id suffix
                 # For each potential foreign key column, check if any table's primary key matches
                 for target_table_name, target_pks in table_pk.items():
                     # Skip self-reference (handled separately)
-                    if target_table_name == source_table.name.lower():
+                    if target_table_name == source_name:
                         continue
                         
                     if not target_pks:
@@ -203,8 +211,7 @@ def infer_foreign_key_relationships(database):
                     
                     # Check if source column refers to this table
                     # For example: customer_id (in orders) should match with an ID in the customers table
-                    prefix = source_col.name[:-3].lower()  # Remove the _id suffix
-                    if prefix == target_table_name or prefix == singular_form(target_table_name):
+                    if prefix == target_table_name or prefix == pk_table_singulars[target_table_name]:
                         target_col = target_pks[0]  # Use the first primary key
                         
                         # Check if relationship already exists
@@ -235,36 +242,25 @@ def infer_foreign_key_relationships(database):
         
         # Second pass: Try singular/plural form matching for table names
         logger.info("[FK Inference] Starting second pass: singular/plural form matching")
-        for source_table in tables:
+        for source_table, source_name, _ in lowered_tables:
             source_columns = list(source_table.columns.all())
             
-            # Get singular and plural forms of the table name
-            singular_table = singular_form(source_table.name.lower())
-            plural_table = plural_form(source_table.name.lower())
-            
             for source_col in source_columns:
                 # Skip if already a foreign key
                 if source_col.is_foreign_key:
                     continue
                 
+                source_col_name = source_col.name.lower()
                 # Try to find matching target table based on column name
-                for target_table in tables:
+                for target_table, target_name, patterns in lowered_tables:
                     # Skip self-reference
-                    if target_table.name.lower() == source_table.name.lower():
+                    if target_name == source_name:
                         continue
-                        
-                    # Check different naming patterns
-                    target_singular = singular_form(target_table.name.lower())
                     
-                    patterns = [
-                        f"{target_singular}_id",
-                        f"{target_table.name.lower()}_id"
-                    ]
-                    
-                    if source_col.name.lower() in patterns:
+                    if source_col_name in patterns:
                         # Find the primary key of the target table
-                        if target_table.name.lower() in table_pk and table_pk[target_table.name.lower()]:
-                            target_col = table_pk[target_table.name.lower()][0]  # Use the first primary key
+                        if table_pk.get(target_name):
+                            target_col = table_pk[target_name][0]  # Use the first primary key
                             
                             # Check if relationship already exists
                             rel_key = (source_table.name, target_table.name, source_col.name, target_col.name)
@@ -294,7 +290,7 @@ def infer_foreign_key_relationships(database):
         
         # Third pass: Try to find relationships based on column name suffix
         logger.info("[FK Inference] Starting third pass: column suffix matching")
-        for source_table in tables:
+        for source_table, source_name, _ in lowered_tables:
             source_columns = list(source_table.columns.all())
             
             for source_col in source_columns:
@@ -303,19 +299,20 @@ def infer_foreign_key_relationships(database):
                     continue
                     
                 # Skip if not ending with _id
-                if not source_col.name.lower().endswith('_id'):
+                source_col_name = source_col.name.lower()
+                if not source_col_name.endswith('_id'):
                     continue
                     
                 # Try to match with any table's primary key that has the same name
-                for target_table in tables:
+                for target_table, target_name, _ in lowered_tables:
                     # Skip self-reference (handled separately)
-                    if target_table.name.lower() == source_table.name.lower():
+                    if target_name == source_name:
                         continue
                         
-                    target_pks = table_pk.get(target_table.name.lower(), [])
+                    target_pks = table_pk.get(target_name, [])
                     for target_pk in target_pks:
                         # Check if the source column matches the target primary key name
-                        if source_col.name.lower() == target_pk.name.lower():
+                        if source_col_name == target_pk.name.lower():
                             # Check if relationship already exists
                             rel_key = (source_table.name, target_table.name, source_col.name, target_pk.name)
                             if rel_key in existing_relations:
@@ -344,9 +341,9 @@ def infer_foreign_key_relationships(database):
         
         # Fourth pass: Handle self-references (e.g., categories.parent_id -> categories.id)
         logger.info("[FK Inference] Starting fourth pass: self-reference detection")
-        for table in tables:
+        for table, table_name, _ in lowered_tables:
             columns = list(table.columns.all())
-            primary_keys = table_pk.get(table.name.lower(), [])
+            primary_keys = table_pk.get(table_name, [])
             
             if not primary_keys:
                 continue
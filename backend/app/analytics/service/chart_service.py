@@ -54,8 +54,8 @@ class ChartService:
 
                 if existing_charts:
                     self.logger.info(f"Found {len(existing_charts)} existing charts for message {message_id}, returning latest")
-                    # Sort by created_at in descending order and return the latest
-                    latest_chart = sorted(existing_charts, key=lambda x: x.created_at.replace(tzinfo=None) if x.created_at.tzinfo else x.created_at, reverse=True)[0]
+                    # Pick the most recent chart by created_at without sorting the whole list
+                    latest_chart = max(existing_charts, key=lambda x: x.created_at.replace(tzinfo=None) if x.created_at.tzinfo else x.created_at)
                     return latest_chart
 
             # If force_create is True, adjustment_query is provided, or no existing charts, proceed with chart creation
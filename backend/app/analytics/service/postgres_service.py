@@ -209,18 +209,11 @@ class PostgresService:
                         schema='public',
                     )
 
-                    # Add columns
-                    current_columns = set()
-                    for col in columns:
-                        current_columns.add(col['name'])
-                        table.get_or_create_column(
-                            name=col['name'],
-                            data_type=col['data_type'],
-                            is_nullable=col['is_nullable'],
-                            is_primary_key=col['is_primary_key'],
-                            default=col['default']
-                        )
+                    # Add columns in a single batched write
+                    current_columns = {col['name'] for col in columns}
+                    table.bulk_upsert_columns(columns)
 
+                    for col in columns:
                         # Log primary key columns for debugging
                         if col['is_primary_key']:
                             self.logger.info(f"Setting primary key for table {table_name}: {col['name']}")
@@ -244,14 +237,25 @@ class PostgresService:
 
                 # After all tables are created, now add the relationships
                 relationships_added = 0
+                # Load live tables and their column names once instead of per table/relationship pair
+                tables_by_name = {}
+                if not database.is_deleted:
+                    for table in database.tables.all():
+                        if not table.is_deleted:
+                            tables_by_name.setdefault(table.name, table)
+                column_names_by_table = {
+                    name: {col.name for col in table.columns.all()}
+                    for name, table in tables_by_name.items()
+                }
+
                 for table_name, table_info in table_columns.items():
-                    source_table = database.get_table_by_name(table_name)
+                    source_table = tables_by_name.get(table_name)
                     if not source_table:
                         continue
 
                     for rel in relationships:
                         target_table_name = rel['referenced_table']
-                        target_table = database.get_table_by_name(target_table_name)
+                        target_table = tables_by_name.get(target_table_name)
 
                         if not target_table:
                             self.logger.warning(f"Cannot add relationship: target table {target_table_name} not found")
@@ -261,25 +265,13 @@ class PostgresService:
                         target_column = rel['referenced_column']
 
                         # Check if the source table has the specified column
-                        source_column_exists = False
-                        for col in source_table.columns.all():
-                            if col.name == source_column:
-                                source_column_exists = True
-                                break
-
-                        if not source_column_exists:
+                        if source_column not in column_names_by_table[table_name]:
                             self.logger.warning(
                                 f"Cannot add relationship: source column {source_table.name}.{source_column} not found")
                             continue
 
                         # Check if the target table has the specified column
-                        target_column_exists = False
-                        for col in target_table.columns.all():
-                            if col.name == target_column:
-                                target_column_exists = True
-                                break
-
-                        if not target_column_exists:
+                        if target_column not in column_names_by_table[target_table_name]:
                             self.logger.warning(
                                 f"Cannot add relationship: target column {target_table_name}.{target_column} not found")
                             continue
@@ -33,6 +33,9 @@ from app.analytics.errors import (
 from pkg.log.logger import Logger
 from app.analytics.entity.analytics import DatabaseType
 from pkg.llm_provider.llm_client import LLMClient
+from app.analytics.constants import EXCEL_MIME_TYPES, EXCEL_EXTENSIONS
+
+
 class SchemaService:
     def __init__(
         self,
@@ -66,8 +69,7 @@ class SchemaService:
             )
 
             # Process each CSV file
-            for file in csv_files:
-                await self._process_csv_file(database, file)
+            await self._process_csv_files(database, csv_files)
 
             # Save changes
             await self.repository.save_database(database)
@@ -86,17 +88,10 @@ class SchemaService:
         """Create a new Excel database and process the file"""
         try:
             # Validate file is Excel format
-            valid_excel_mime_types = [
-                "application/vnd.ms-excel",  # .xls
-                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",  # .xlsx
-                "application/vnd.ms-excel.sheet.macroEnabled.12"  # .xlsm
-            ]
-            
-            # Check content type
-            if excel_file.content_type not in valid_excel_mime_types:
+            if excel_file.content_type not in EXCEL_MIME_TYPES:
                 # Also check filename extension as fallback
                 filename = excel_file.filename.lower() if excel_file.filename else ""
-                if not (filename.endswith('.xlsx') or filename.endswith('.xls') or filename.endswith('.xlsm')):
+                if not filename.endswith(EXCEL_EXTENSIONS):
                     raise InvalidFileFormatError("Invalid file format. Only Excel files are accepted.")
                     
             # Create database in our system
@@ -127,8 +122,7 @@ class SchemaService:
         """Add more CSV files to an existing database"""
         try:
             # Process each new CSV file
-            for file in csv_files:
-                await self._process_csv_file(database, file)
+            await self._process_csv_files(database, csv_files)
 
             # Save changes
             await self.repository.save_database(database)
@@ -138,7 +132,24 @@ class SchemaService:
             self.logger.error(f"Error adding CSV files: {str(e)}")
             raise
 
-    async def _process_csv_file(self, database: Any, file: UploadFile) -> None:
+    async def _process_csv_files(self, database: Any, csv_files: List[UploadFile]) -> None:
+        """Process CSV files, embedding all of their table names in batched requests"""
+        table_names = list(dict.fromkeys(
+            os.path.splitext(file.filename)[0] for file in csv_files if file.filename
+        ))
+        # On failure fall back to per-file embedding calls in _process_csv_file
+        try:
+            embeddings = dict(zip(table_names, await self.llm_client.get_embeddings(table_names))) if table_names else {}
+        except Exception as e:
+            self.logger.warning(f"Batched table embedding failed, embedding files individually: {str(e)}")
+            embeddings = {}
+
+        for file in csv_files:
+            table_name = os.path.splitext(file.filename)[0] if file.filename else None
+            await self._process_csv_file(database, file, embeddings.get(table_name))
+
+    async def _process_csv_file(self, database: Any, file: UploadFile,
+                                embedding: Optional[List[float]] = None) -> None:
         """Process a single CSV file"""
         try:
             # Read file content
@@ -154,8 +165,9 @@ class SchemaService:
                 raise ValueError("File must have a filename")
             table_name = os.path.splitext(file.filename)[0]
             
-            # Get table embedding for semantic search
-            embedding = await self.llm_client.get_embedding(table_name)
+            # Get table embedding for semantic search unless the caller batched it already
+            if embedding is None:
+                embedding = await self.llm_client.get_embedding(table_name)
             
             try:
                 # Try to find existing table in this database first
@@ -218,6 +230,7 @@ class SchemaService:
                 raise StorageError(str(e))
             
             # Process columns with enhanced type inference
+            columns = []
             for column_name in df.columns:
                 # Get column data
                 col_data = df[column_name]
@@ -273,13 +286,15 @@ class SchemaService:
                 else:
                     data_type = 'text'
                 
-                # Create or update column
-                table.get_or_create_column(
-                    name=column_name,
-                    data_type=data_type,
-                    is_nullable=stats["is_nullable"],
-                    stats=stats
-                )
+                columns.append({
+                    'name': column_name,
+                    'data_type': data_type,
+                    'is_nullable': stats["is_nullable"],
+                    'stats': stats
+                })
+
+            # Create or update all columns in one batched write
+            table.bulk_upsert_columns(columns)
 
         except Exception as e:
             self.logger.error(f"Error processing CSV file {file.filename}: {str(e)}")
@@ -382,6 +397,13 @@ class SchemaService:
 
             # Process specific sheet or all sheets
             sheets_to_process = [sheet_name] if sheet_name else excel_file.sheet_names
+
+            # Embed all sheet names in batched requests; on failure fall back to per-sheet calls below
+            try:
+                sheet_embeddings = dict(zip(sheets_to_process, await self.llm_client.get_embeddings(sheets_to_process)))
+            except Exception as e:
+                self.logger.warning(f"Batched sheet embedding failed, embedding sheets individually: {str(e)}")
+                sheet_embeddings = {}
             
             # Process each sheet
             for current_sheet in sheets_to_process:
@@ -400,7 +422,9 @@ class SchemaService:
                     table_name = current_sheet
                     
                     # Get table embedding for semantic search
-                    embedding = await self.llm_client.get_embedding(table_name)
+                    embedding = sheet_embeddings.get(table_name)
+                    if embedding is None:
+                        embedding = await self.llm_client.get_embedding(table_name)
                     
                     # Create a new table
                     table = database.get_or_create_table(
@@ -418,6 +442,7 @@ class SchemaService:
                     )
                     
                     # Process columns for this sheet
+                    columns = []
                     for column_name in df.columns:
                         # Get column data
                         col_data = df[column_name]
@@ -439,12 +464,15 @@ class SchemaService:
                         is_nullable = col_data.isnull().any()
                         
                         # Create column without detailed stats
-                        table.get_or_create_column(
-                            name=column_name,
-                            data_type=data_type,
-                            is_nullable=is_nullable,
-                            stats={}  # Empty stats for now
-                        )
+                        columns.append({
+                            'name': column_name,
+                            'data_type': data_type,
+                            'is_nullable': bool(is_nullable),
+                            'stats': {}  # Empty stats for now
+                        })
+
+                    # Create or update all columns in one batched write
+                    table.bulk_upsert_columns(columns)
                     
                     self.logger.info(f"Successfully processed sheet '{current_sheet}' and created table '{table_name}'")
                     
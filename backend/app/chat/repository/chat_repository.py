@@ -21,6 +21,9 @@ from app.chat.service.service import IChatRepository
 
 
 class ChatRepository(IChatRepository):
+    # Message pages at least this large are converted to entities off the event loop
+    OFFLOAD_CONVERSION_THRESHOLD = 500
+
     def __init__(self, db_conn: PostgresConnection, logger: Logger):
         self.logger = logger
         self.db_conn = db_conn
@@ -39,7 +42,7 @@ class ChatRepository(IChatRepository):
                 
                 try:
                     # Check if conversation exists and belongs to the user
-                    stmt = select(ConversationModel).where(
+                    stmt = select(ConversationModel.id).where(
                         and_(
                             ConversationModel.id == conversation.id,
                             ConversationModel.user_id == user_id
@@ -105,7 +108,7 @@ class ChatRepository(IChatRepository):
                 
                 try:
                     # First check if conversation exists and belongs to the user
-                    stmt = select(ConversationModel).where(
+                    stmt = select(ConversationModel.id).where(
                         and_(
                             ConversationModel.id == message.conversation_id,
                             ConversationModel.user_id == user_id
@@ -184,11 +187,14 @@ class ChatRepository(IChatRepository):
                         .limit(page_size)
                     )
                     
-                    messages_result = await session.execute(messages_stmt)
-                    messages = messages_result.scalars().all()
+                    # Stream in batches so long conversations don't hold every
+                    # ORM row (with its JSONB payloads) in memory at once
+                    messages = await session.stream_scalars(
+                        messages_stmt.execution_options(yield_per=500)
+                    )
                     
                     # Convert to entities
-                    message_entities = [message.to_entity() for message in messages]
+                    message_entities = [message.to_entity() async for message in messages]
                     conversation_entity.messages = message_entities
                 
                 return conversation_entity
@@ -210,14 +216,15 @@ class ChatRepository(IChatRepository):
                 # Add ordering
                 query = query.order_by(desc(ConversationModel.created_at))
                 
-                result = await session.execute(query)
-                conversations = result.scalars().all()
+                # Stream in partitions so users with many conversations don't
+                # materialise every ORM row before conversion
+                result = await session.stream_scalars(query.execution_options(yield_per=1000))
                 
                 # Convert to entities
-                conversation_entities = []
-                for conv in conversations:
-                    conversation_entity = conv.to_entity()
-                    conversation_entities.append(conversation_entity)
+                to_entity = ConversationModel.to_entity
+                conversation_entities: List[ConversationEntity] = []
+                async for partition in result.partitions():
+                    conversation_entities.extend(map(to_entity, partition))
                 
                 return conversation_entities
                 
@@ -265,23 +272,32 @@ class ChatRepository(IChatRepository):
                 await session.begin()
                 
                 try:
-                    # Check if conversation exists and belongs to the user
-                    conv_stmt = select(ConversationModel).where(
-                        and_(
-                            ConversationModel.id == conversation_id,
-                            ConversationModel.user_id == user_id
+                    # Delete the conversation (scoped to the user) and its messages in a
+                    # single statement using writable CTEs; the FK has no ON DELETE
+                    # CASCADE, but both deletes complete before it is checked
+                    deleted_conversation = (
+                        delete(ConversationModel)
+                        .where(
+                            and_(
+                                ConversationModel.id == conversation_id,
+                                ConversationModel.user_id == user_id
+                            )
                         )
+                        .returning(ConversationModel.id)
+                        .cte("deleted_conversation")
                     )
-                    result = await session.execute(conv_stmt)
-                    conversation = result.scalars().first()
+                    deleted_messages = (
+                        delete(MessageModel)
+                        .where(MessageModel.conversation_id.in_(select(deleted_conversation.c.id)))
+                        .returning(MessageModel.id)
+                        .cte("deleted_messages")
+                    )
+                    delete_stmt = select(deleted_conversation.c.id).add_cte(deleted_messages)
+                    result = await session.execute(delete_stmt)
                     
-                    if not conversation:
+                    if result.scalar_one_or_none() is None:
                         raise Exception(f"Conversation {conversation_id} not found or access denied")
                     
-                    # Delete the conversation (cascade will delete messages)
-                    delete_stmt = delete(ConversationModel).where(ConversationModel.id == conversation_id)
-                    await session.execute(delete_stmt)
-                    
                     # Commit transaction
                     await session.commit()
                     
@@ -304,7 +320,7 @@ class ChatRepository(IChatRepository):
                 
                 try:
                     # Verify user has access to the conversation
-                    access_stmt = select(ConversationModel).where(
+                    access_stmt = select(ConversationModel.id).where(
                         and_(
                             ConversationModel.id == conversation_id,
                             ConversationModel.user_id == user_id
@@ -352,7 +368,7 @@ class ChatRepository(IChatRepository):
                 
                 try:
                     # Verify user has access to the conversation
-                    access_stmt = select(ConversationModel).where(
+                    access_stmt = select(ConversationModel.id).where(
                         and_(
                             ConversationModel.id == conversation_id,
                             ConversationModel.user_id == user_id
@@ -398,16 +414,17 @@ class ChatRepository(IChatRepository):
         try:
             async with self.db_conn.get_session() as session:
                 # Check if conversation exists
-                conv_stmt = select(ConversationModel).where(ConversationModel.id == conversation_id)
+                conv_stmt = select(ConversationModel.id).where(ConversationModel.id == conversation_id)
                 conv_result = await session.execute(conv_stmt)
                 conversation = conv_result.scalars().first()
                 
                 if not conversation:
                     raise Exception(f"Conversation {conversation_id} not found")
                 
-                # Query messages with pagination
+                # Query message columns with pagination; rows are copied to plain
+                # dicts so nothing handed to the thread pool touches the session
                 stmt = (
-                    select(MessageModel)
+                    select(*MessageModel.__table__.columns)
                     .where(MessageModel.conversation_id == conversation_id)
                     .order_by(MessageModel.index)
                     .offset(offset)
@@ -415,12 +432,19 @@ class ChatRepository(IChatRepository):
                 )
                 
                 result = await session.execute(stmt)
-                messages = result.scalars().all()
-                
-                # Convert to entities
-                message_entities: List[MessageEntity] = [message.to_entity() for message in messages]
-                
-                return message_entities
+                rows = [dict(row) for row in result.mappings().all()]
+            
+            # Convert to entities; large pages are converted on the thread pool
+            # so the event loop stays free for other requests meanwhile
+            if len(rows) >= self.OFFLOAD_CONVERSION_THRESHOLD:
+                loop = asyncio.get_running_loop()
+                message_entities: List[MessageEntity] = await loop.run_in_executor(
+                    self.thread_pool, lambda: [MessageModel.entity_from_row(row) for row in rows]
+                )
+            else:
+                message_entities = [MessageModel.entity_from_row(row) for row in rows]
+            
+            return message_entities
 
         except Exception as e:
             self.logger.error(f"Error getting messages for conversation {conversation_id}: {str(e)}", exc_info=True)
@@ -440,50 +464,49 @@ class ChatRepository(IChatRepository):
                     # Group messages by conversation for validation
                     conversation_ids = {msg.conversation_id for msg in messages}
                     
-                    # Verify all conversations exist and belong to the user
-                    for conv_id in conversation_ids:
-                        stmt = select(ConversationModel).where(
-                            and_(
-                                ConversationModel.id == conv_id,
-                                ConversationModel.user_id == user_id
-                            )
+                    # Verify all conversations exist and belong to the user in one query
+                    stmt = select(ConversationModel.id).where(
+                        and_(
+                            ConversationModel.id.in_(conversation_ids),
+                            ConversationModel.user_id == user_id
                         )
-                        result = await session.execute(stmt)
-                        conversation = result.scalars().first()
-                        
-                        if not conversation:
-                            raise Exception(f"Conversation {conv_id} not found or access denied")
+                    )
+                    result = await session.execute(stmt)
+                    missing_ids = conversation_ids - set(result.scalars().all())
                     
-                    # Convert entities to models and add to session
-                    message_models = []
-                    message_ids = []
+                    if missing_ids:
+                        raise Exception(f"Conversation {next(iter(missing_ids))} not found or access denied")
                     
-                    for message in messages:
-                        message_model = MessageModel.from_entity(message)
-                        session.add(message_model)
-                        message_models.append(message_model)
-                        message_ids.append(message.id)
+                    # Insert all rows in one executemany-style statement rather than
+                    # going through the ORM unit of work per object
+                    row_from_entity = MessageModel.row_from_entity
+                    await session.execute(
+                        insert(MessageModel),
+                        [row_from_entity(message) for message in messages]
+                    )
+                    message_ids = [message.id for message in messages]
                     
                     # Update the current_leaf_message_id for each conversation
-                    # We use the last message in each conversation as the leaf
-                    for conv_id in conversation_ids:
-                        # Find the last message in this conversation
-                        conv_messages = [msg for msg in messages if msg.conversation_id == conv_id]
-                        if conv_messages:
-                            # Sort by index to get the last message
-                            last_message = max(conv_messages, key=lambda m: m.index)
-                            
-                            # Update the conversation
-                            update_stmt = (
-                                update(ConversationModel)
-                                .where(ConversationModel.id == conv_id)
-                                .values(
-                                    current_leaf_message_id=last_message.id,
-                                    updated_at=datetime.now(timezone.utc),
-                                    last_activity_at=datetime.now(timezone.utc)
-                                )
+                    # We use the last message (highest index) in each conversation as the leaf,
+                    # found in a single pass over the batch
+                    last_messages: Dict[uuid.UUID, MessageEntity] = {}
+                    for message in messages:
+                        current = last_messages.get(message.conversation_id)
+                        if current is None or message.index > current.index:
+                            last_messages[message.conversation_id] = message
+                    
+                    for conv_id, last_message in last_messages.items():
+                        # Update the conversation
+                        update_stmt = (
+                            update(ConversationModel)
+                            .where(ConversationModel.id == conv_id)
+                            .values(
+                                current_leaf_message_id=last_message.id,
+                                updated_at=datetime.now(timezone.utc),
+                                last_activity_at=datetime.now(timezone.utc)
                             )
-                            await session.execute(update_stmt)
+                        )
+                        await session.execute(update_stmt)
                     
                     # Commit the transaction
                     await session.commit()
@@ -509,7 +532,7 @@ class ChatRepository(IChatRepository):
                 try:
                     # Check if message exists and belongs to the user
                     access_stmt = (
-                        select(MessageModel)
+                        select(MessageModel.id)
                         .join(
                             ConversationModel, 
                             MessageModel.conversation_id == ConversationModel.id
@@ -4,9 +4,24 @@ from sqlalchemy.sql import func
 import uuid
 from datetime import datetime, timezone
 import json
+from typing import List
+
+from pydantic import TypeAdapter
 
 from pkg.db_util.sql_alchemy.declarative_base import Base
-from app.chat.entity.chat import Role
+from app.chat.entity.chat import (
+    Role, Document, CodeSnippet, Artifact, Attachment, Suggestion, File, Reference,
+)
+
+# Prebuilt (de)serializers for the JSONB list columns on messages, so each list is
+# validated/dumped in one pydantic-core call instead of per item
+_DOCUMENTS = TypeAdapter(List[Document])
+_CODES = TypeAdapter(List[CodeSnippet])
+_ARTIFACTS = TypeAdapter(List[Artifact])
+_ATTACHMENTS = TypeAdapter(List[Attachment])
+_REFERENCES = TypeAdapter(List[Reference])
+_SUGGESTIONS = TypeAdapter(List[Suggestion])
+_FILES = TypeAdapter(List[File])
 
 
 class ConversationModel(Base):
@@ -53,6 +68,9 @@ class ConversationModel(Base):
         )
 
 
+_JSON_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
 def serialize_datetime(obj: dict) -> dict:
     """
     Recursively convert datetime objects in a dictionary to ISO format strings.
@@ -64,6 +82,9 @@ def serialize_datetime(obj: dict) -> dict:
     Returns:
         dict: Dictionary with datetime and UUID objects converted to strings
     """
+    # Fast path: most leaves in meta_data are plain JSON scalars
+    if type(obj) in _JSON_SCALAR_TYPES:
+        return obj
     if isinstance(obj, dict):
         return {k: serialize_datetime(v) for k, v in obj.items()}
     elif isinstance(obj, list):
@@ -102,52 +123,34 @@ class MessageModel(Base):
     meta_data = Column(JSONB, nullable=True)
     
     def to_entity(self):
-        from app.chat.entity.chat import (
-            Message, Document, CodeSnippet, Role, Artifact, 
-            Attachment, Suggestion, File, Reference,
-        )
+        return MessageModel.entity_from_row({key: getattr(self, key) for key in _MESSAGE_COLUMN_KEYS})
+
+    @staticmethod
+    def entity_from_row(row):
+        """Build a message entity from plain column values (a dict or a result row mapping)"""
+        from app.chat.entity.chat import Message
         
         # Parse JSON fields to their respective objects
-        documents_list = []
-        if self.documents:
-            documents_list = [Document(**doc) for doc in self.documents]
-            
-        codes_list = []
-        if self.codes:
-            codes_list = [CodeSnippet(**code) for code in self.codes]
-            
-        artifacts_list = []
-        if self.artifacts:
-            artifacts_list = [Artifact(**artifact) for artifact in self.artifacts]
-            
-        attachments_list = []
-        if self.attachments:
-            attachments_list = [Attachment(**attachment) for attachment in self.attachments]
-            
-        references_list = []
-        if self.references:
-            references_list = [Reference(**ref) for ref in self.references]
-            
-        suggestions_list = []
-        if self.suggestions:
-            suggestions_list = [Suggestion(**suggestion) for suggestion in self.suggestions]
-            
-        files_list = []
-        if self.files:
-            files_list = [File(**file) for file in self.files]
+        documents_list = _DOCUMENTS.validate_python(row["documents"]) if row["documents"] else []
+        codes_list = _CODES.validate_python(row["codes"]) if row["codes"] else []
+        artifacts_list = _ARTIFACTS.validate_python(row["artifacts"]) if row["artifacts"] else []
+        attachments_list = _ATTACHMENTS.validate_python(row["attachments"]) if row["attachments"] else []
+        references_list = _REFERENCES.validate_python(row["references"]) if row["references"] else []
+        suggestions_list = _SUGGESTIONS.validate_python(row["suggestions"]) if row["suggestions"] else []
+        files_list = _FILES.validate_python(row["files"]) if row["files"] else []
         
         return Message(
-            id=self.id,
-            conversation_id=self.conversation_id,
-            parent_message_id=self.parent_message_id,
-            role=Role(self.role),
-            content=self.content,
-            model=self.model,
-            index=self.index,
-            stop_reason=self.stop_reason,
-            database_uid=self.database_uid,
-            table_uid=self.table_uid,
-            created_at=self.created_at,
+            id=row["id"],
+            conversation_id=row["conversation_id"],
+            parent_message_id=row["parent_message_id"],
+            role=Role(row["role"]),
+            content=row["content"],
+            model=row["model"],
+            index=row["index"],
+            stop_reason=row["stop_reason"],
+            database_uid=row["database_uid"],
+            table_uid=row["table_uid"],
+            created_at=row["created_at"],
             documents=documents_list,
             codes=codes_list,
             artifacts=artifacts_list,
@@ -155,22 +158,28 @@ class MessageModel(Base):
             references=references_list,
             suggestions=suggestions_list,
             files=files_list,
-            meta_data=self.meta_data or {}
+            meta_data=row["meta_data"] or {}
         )
     
     @staticmethod
     def from_entity(entity):
-        # Convert entity lists to dictionaries for JSON storage
-        documents = [serialize_datetime(doc.dict()) for doc in entity.documents] if entity.documents else None
-        codes = [serialize_datetime(code.dict()) for code in entity.codes] if entity.codes else None
-        artifacts = [serialize_datetime(artifact.dict()) for artifact in entity.artifacts] if entity.artifacts else None
-        attachments = [serialize_datetime(attachment.dict()) for attachment in entity.attachments] if entity.attachments else None
-        references = [serialize_datetime(ref.dict()) for ref in entity.references] if entity.references else None
-        suggestions = [serialize_datetime(suggestion.dict()) for suggestion in entity.suggestions] if entity.suggestions else None
-        files = [serialize_datetime(file.dict()) for file in entity.files] if entity.files else None
+        return MessageModel(**MessageModel.row_from_entity(entity))
+
+    @staticmethod
+    def row_from_entity(entity) -> dict:
+        """Column values for a message entity, usable for bulk (executemany) inserts"""
+        # Convert entity lists to dictionaries for JSON storage. mode="json" emits
+        # datetimes/UUIDs as strings in the same pass, so no second walk is needed
+        documents = _DOCUMENTS.dump_python(entity.documents, mode="json", warnings=False) if entity.documents else None
+        codes = _CODES.dump_python(entity.codes, mode="json", warnings=False) if entity.codes else None
+        artifacts = _ARTIFACTS.dump_python(entity.artifacts, mode="json", warnings=False) if entity.artifacts else None
+        attachments = _ATTACHMENTS.dump_python(entity.attachments, mode="json", warnings=False) if entity.attachments else None
+        references = _REFERENCES.dump_python(entity.references, mode="json", warnings=False) if entity.references else None
+        suggestions = _SUGGESTIONS.dump_python(entity.suggestions, mode="json", warnings=False) if entity.suggestions else None
+        files = _FILES.dump_python(entity.files, mode="json", warnings=False) if entity.files else None
         meta_data = serialize_datetime(entity.meta_data) if entity.meta_data else None
         
-        return MessageModel(
+        return dict(
             id=entity.id,
             conversation_id=entity.conversation_id,
             parent_message_id=entity.parent_message_id,
@@ -193,6 +202,10 @@ class MessageModel(Base):
         )
 
 
+# Attribute names of the message columns, read by MessageModel.to_entity
+_MESSAGE_COLUMN_KEYS = tuple(column.key for column in MessageModel.__table__.columns)
+
+
 class ChartModel(Base):
     __tablename__ = "charts"
     
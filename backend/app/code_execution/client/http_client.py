@@ -1,4 +1,4 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from uuid import UUID
 from app.code_execution.api.dto import CodeExecutionRequestDTO, CodeExecutionResponseDTO, CodeExecutionResultDTO, \
     CodeExecutionStatusDTO
@@ -9,6 +9,7 @@ import numpy as np
 import json
 from io import StringIO
 import re
+import threading
 
 
 class CodeExecutionClient:
@@ -16,6 +17,30 @@ class CodeExecutionClient:
         self.base_url: str = base_url
 
         self.token_client: TokenClient = token_client
+        # One long-lived session per thread so calls to the execution service reuse pooled
+        # keep-alive connections; requests.Session is not safe to share across threads
+        self._local = threading.local()
+        self._sessions: List[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """Return the calling thread's session, creating it on first use."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self) -> None:
+        """Close every session opened by this client."""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
 
     def _clean_input_data(self, input_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         """Clean input data to handle non-JSON-compliant values."""
@@ -81,7 +106,7 @@ class CodeExecutionClient:
             requests.exceptions.RequestException: If the request fails
         """
         try:
-            response = requests.request(
+            response = self.session.request(
                 method=method,
                 url=f"{self.base_url}{endpoint}",
                 json=data,
@@ -170,7 +195,7 @@ if 'df' in input_data:
             input_data=input_data
         ).model_dump()
 
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/execute/async",
             json=request_data,
             headers=self.headers
@@ -180,7 +205,7 @@ if 'df' in input_data:
         return CodeExecutionResponseDTO(**response.json())
 
     def get_execution_status(self, execution_id: UUID) -> CodeExecutionStatusDTO:
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/execute/{execution_id}",
             headers=self.headers
         )
@@ -189,7 +214,7 @@ if 'df' in input_data:
         return CodeExecutionStatusDTO(**response.json())
 
     def get_execution_result(self, execution_id: UUID) -> CodeExecutionResultDTO:
-        response = requests.get(
+        response = self.session.get(
             f"{self.base_url}/execute/{execution_id}/result",
             headers=self.headers
         )
@@ -198,7 +223,7 @@ if 'df' in input_data:
         return CodeExecutionResultDTO(**response.json())
 
     def cancel_execution(self, execution_id: UUID) -> CodeExecutionResponseDTO:
-        response = requests.delete(
+        response = self.session.delete(
             f"{self.base_url}/execute/{execution_id}",
             headers=self.headers
         )
@@ -144,12 +144,13 @@ class ExecutionRepository(IExecutionRepository):
             try:
                 session.add(execution_model)
                 await session.commit()
-                await session.refresh(execution_model)
 
                 # Cache the status
-                self._cache_status(execution_model.id, ExecutionStatus.QUEUED)
+                self._cache_status(execution.id, ExecutionStatus.QUEUED)
 
-                return execution_model.to_entity()
+                # Every column is set client-side from the entity, so there is
+                # nothing to read back from the server
+                return execution
 
             except Exception as e:
                 self.logger.error(f"Error creating execution: {str(e)}")
@@ -179,12 +180,13 @@ class ExecutionRepository(IExecutionRepository):
             try:
                 session.add(execution_model)
                 await session.commit()
-                await session.refresh(execution_model)
 
                 # Cache the status
-                self._cache_status(execution_model.id, status)
+                self._cache_status(execution.id, status)
 
-                return execution_model.to_entity()
+                # Every column is set client-side from the entity, so there is
+                # nothing to read back from the server
+                return execution
 
             except Exception as e:
                 self.logger.error(f"Error creating execution with status {status}: {str(e)}")
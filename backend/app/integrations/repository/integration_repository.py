@@ -89,12 +89,22 @@ class IntegrationRepository(IIntegrationRepository):
     async def update_user_integration(
         self, user_id: str, user_integration: UserIntegration
     ) -> UserIntegration:
-
-        async with self.db_conn.get_session() as session:
-            stmt = select(IntegrationModel).where(
+        stmt = (
+            update(IntegrationModel)
+            .where(
                 IntegrationModel.id == user_integration.integration_id,
                 IntegrationModel.user_id == user_id
             )
+            .values(
+                credential=user_integration.credential,
+                expires_at=user_integration.expires_at,
+                settings=user_integration.settings,
+                is_active=user_integration.is_active,
+            )
+            .returning(IntegrationModel)
+        )
+
+        async with self.db_conn.get_session() as session:
             result = await session.execute(stmt)
             integration_model = result.scalar_one_or_none()
 
@@ -103,13 +113,7 @@ class IntegrationRepository(IIntegrationRepository):
                     f"Integration not found for user {user_id} with id {user_integration.integration_id}"
                 )
 
-            integration_model.credential = user_integration.credential
-            integration_model.expires_at = user_integration.expires_at
-            integration_model.settings = user_integration.settings
-            integration_model.is_active = user_integration.is_active
-
             await session.commit()
-            await session.refresh(integration_model)
             return integration_model.to_entity()
 
     async def update_latest_checkpoint_integration(self,user_id: str, integration_id: UUID, checkpoint: str,) -> bool:
@@ -277,26 +281,31 @@ class IntegrationRepository(IIntegrationRepository):
         if not sync_integration.sync_id:
              raise ValueError("Sync ID is required for updates.")
 
-        async with self.db_conn.get_session() as session:
-             stmt = select(IntegrationSyncModel).where(
-                 IntegrationSyncModel.id == sync_integration.sync_id,
-                 IntegrationSyncModel.user_id == sync_integration.user_id
-             )
-             result = await session.execute(stmt)
-             sync_model = result.scalar_one_or_none()
+        stmt = (
+            update(IntegrationSyncModel)
+            .where(
+                IntegrationSyncModel.id == sync_integration.sync_id,
+                IntegrationSyncModel.user_id == sync_integration.user_id
+            )
+            .values(
+                status=sync_integration.status,
+                error_message=sync_integration.error_message,
+                completed_at=sync_integration.completed_at,
+            )
+            .returning(IntegrationSyncModel)
+        )
 
-             if not sync_model:
-                 raise NoResultFound(
-                     f"Sync integration not found for user {sync_integration.user_id} with id {sync_integration.sync_id}"
-                 )
+        async with self.db_conn.get_session() as session:
+            result = await session.execute(stmt)
+            sync_model = result.scalar_one_or_none()
 
-             sync_model.status = sync_integration.status
-             sync_model.error_message = sync_integration.error_message
-             sync_model.completed_at = sync_integration.completed_at
+            if not sync_model:
+                raise NoResultFound(
+                    f"Sync integration not found for user {sync_integration.user_id} with id {sync_integration.sync_id}"
+                )
 
-             await session.commit()
-             await session.refresh(sync_model)
-             return sync_model.to_entity()
+            await session.commit()
+            return sync_model.to_entity()
 
     async def get_user_integration_by_id(
         self, user_id: str, integration_id: UUID
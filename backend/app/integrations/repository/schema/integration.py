@@ -11,6 +11,8 @@ from neomodel import (
     UniqueIdProperty,
 )
 
+from pkg.util.time import utcnow
+
 
 class Integration(StructuredNode):
     uid: str = UniqueIdProperty()
@@ -18,8 +20,8 @@ class Integration(StructuredNode):
     credential: dict[str, Any] = JSONProperty()
     integration_provider = StringProperty()
     scopes: str = ArrayProperty(StringProperty())
-    created_at: datetime = DateTimeProperty(default=datetime.utcnow)
-    updated_at: datetime = DateTimeProperty(default=datetime.utcnow)
+    created_at: datetime = DateTimeProperty(default=utcnow)
+    updated_at: datetime = DateTimeProperty(default=utcnow)
     expires_at: datetime | None = DateTimeProperty()
     user_id: str = StringProperty(required=True)
     settings: dict[str, Any] | None = JSONProperty()
@@ -1,4 +1,6 @@
+import asyncio
 import uuid
+import weakref
 from datetime import datetime, timezone
 from uuid import UUID
 from app.knowledge_base.service.service import (IKnowledgeIngestionService,
@@ -16,6 +18,8 @@ from app.integrations.entity.value_object import SyncStatus
 class KnowledgeIngestionService(IKnowledgeIngestionService):
     """Enhanced knowledge ingestion service with  technique support"""
 
+    # Per (user_id, integration_id) locks shared by all instances; entries drop once no run holds them
+    _sync_locks = weakref.WeakValueDictionary()
 
     def __init__(self, logger: Logger, integration_adapter: IIntegrationAdapter, postgres_service: PostgresService):
 
@@ -24,6 +28,10 @@ class KnowledgeIngestionService(IKnowledgeIngestionService):
         self.logger: Logger = logger
         self.integration_adapter: IIntegrationAdapter = integration_adapter
         self.postgres_service: PostgresService = postgres_service
+        # Integration type -> processor; types without an entry are not implemented yet
+        self._integration_processors = {
+            IntegrationType.POSTGRESQL: self.process_postgres_integration,
+        }
         self.logger.info("Initializing Knowledge Ingestion Service")
 
 
@@ -46,36 +54,45 @@ class KnowledgeIngestionService(IKnowledgeIngestionService):
                 # Sync doesn't exist, log error and exit gracefully
                 self.logger.error(f"Sync integration not found: {e}")
                 return
-                
-            # Get integration details
-            user_integration: UserIntegration = await self.integration_adapter.get_integration(user_id,
-                                                                                               integration_sync.integration_id)
 
+            # Serialize concurrent runs for the same integration within this process
+            lock = self._sync_locks.setdefault((user_id, integration_sync.integration_id), asyncio.Lock())
+            waited = lock.locked()
+            async with lock:
+                if waited:
+                    # The run we waited on may have finished this sync; reload its status
+                    integration_sync = await self.integration_adapter.get_sync_integration(user_id, sync_id)
+
+                # Check integration status
+                if integration_sync.status == "COMPLETED":
+                    self.logger.info("Integration sync already completed", extra={"user_id": user_id, "sync_id": sync_id})
+                    return
+                elif integration_sync.status == "FAILED":
+                    self.logger.info("Integration sync failed previously, starting again",
+                                     extra={"user_id": user_id, "sync_id": sync_id})
+                elif integration_sync.status == "PROCESSING":
+                    self.logger.info("Integration sync already in progress, continuing",
+                                     extra={"user_id": user_id, "sync_id": sync_id})
+
+                # Process integration based on its type; the final status is written once below.
+                # The sync row already carries the type, so unimplemented types skip the integration fetch.
+                processor = self._integration_processors.get(integration_sync.integration_type)
+                if processor is None:
+                    self.logger.info(f"{integration_sync.integration_type} integration sync not implemented yet")
+                else:
+                    # Get integration details
+                    user_integration: UserIntegration = await self.integration_adapter.get_integration(
+                        user_id, integration_sync.integration_id)
+
+                    # Only flag a retry as in progress when there is actual work to do
+                    if integration_sync.status == "FAILED":
+                        await self.integration_adapter.update_sync_status(user_id, sync_id, SyncStatus.PROCESSING.value)
+                    await processor(user_id, sync_id, user_integration)
+                    self.logger.info("Sync completed successfully", extra={"user_id": user_id, "sync_id": sync_id})
 
-            # Check integration status
-            if integration_sync.status == "COMPLETED":
-                self.logger.info("Integration sync already completed", extra={"user_id": user_id, "sync_id": sync_id})
-                return
-            elif integration_sync.status == "FAILED":
-                self.logger.info("Integration sync failed previously, starting again",
-                                 extra={"user_id": user_id, "sync_id": sync_id})
-
-                await self.integration_adapter.update_sync_status(user_id, sync_id, SyncStatus.PROCESSING.value)
-            elif integration_sync.status == "PROCESSING":
-                self.logger.info("Integration sync already in progress, continuing",
-                                 extra={"user_id": user_id, "sync_id": sync_id})
-            # Process integration based on its type
-            if user_integration.integration_type == IntegrationType.POSTGRESQL:
-                await self.process_postgres_integration(user_id, sync_id, user_integration)
-            else:
-                self.logger.info(f"{user_integration.integration_type} integration sync not implemented yet")
                 await self.integration_adapter.update_sync_status(user_id, sync_id, SyncStatus.COMPLETED.value)
                 return
 
-            self.logger.info("Sync completed successfully", extra={"user_id": user_id, "sync_id": sync_id})
-            await self.integration_adapter.update_sync_status(user_id, sync_id, SyncStatus.COMPLETED.value)
-            return
-
         except Exception as e:
             self.logger.error("Sync failed" + str(e))
             await self.integration_adapter.update_sync_status(user_id, sync_id, SyncStatus.FAILED.value, str(e))
@@ -1,8 +1,10 @@
+import asyncio
 import uuid
 from typing import List, Optional, Any
 from datetime import datetime
 
-from sqlalchemy import select, insert, update, delete, and_, or_, func
+from sqlalchemy import select, insert, update, delete, and_, or_, func, any_, bindparam, String
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.tokens.entities.entity import (UserTokens as UserTokensEntity, UserSubscription as UserSubscriptionEntity,
@@ -169,7 +171,7 @@ class TokensRepository(ITokensRepository):
                 users_to_refill_stmt = (
                     select(UserTokensModel.user_id)
                     .where(
-                        UserTokensModel.user_id.in_(free_user_ids),
+                        UserTokensModel.user_id == any_(bindparam('free_user_ids', free_user_ids, type_=ARRAY(String))),
                         UserTokensModel.current_credits < refill_amount
                     )
                 )
@@ -187,7 +189,7 @@ class TokensRepository(ITokensRepository):
                     async with session.begin():
                         update_stmt = (
                             update(UserTokensModel)
-                            .where(UserTokensModel.user_id.in_(batch_users))
+                            .where(UserTokensModel.user_id == any_(bindparam('batch_users', batch_users, type_=ARRAY(String))))
                             .values(
                                 current_credits=refill_amount,
                                 total_credits=UserTokensModel.total_credits + refill_amount,
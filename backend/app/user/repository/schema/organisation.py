@@ -10,6 +10,8 @@ from neomodel import (
     UniqueIdProperty,
 )
 
+from pkg.util.time import utcnow
+
 if TYPE_CHECKING:
     from app.user.repository.schema.user import User
 
@@ -23,8 +25,8 @@ class Organisation(StructuredNode):
     address: str = StringProperty()
     logo: str = StringProperty()
     admin_position: str = StringProperty()
-    created_at: datetime = DateTimeProperty(default=datetime.utcnow)
-    updated_at: datetime = DateTimeProperty(default=datetime.utcnow)
+    created_at: datetime = DateTimeProperty(default=utcnow)
+    updated_at: datetime = DateTimeProperty(default=utcnow)
     created_by: str = StringProperty(required=True)  # User UID
 
     # Use string references for relationships
@@ -12,6 +12,8 @@ from neomodel import (
     UniqueIdProperty,
 )
 
+from pkg.util.time import utcnow
+
 # Only import Organisation for type hints if type checking
 if TYPE_CHECKING:
     from app.user.repository.schema.organisation import Organisation
@@ -19,8 +21,8 @@ if TYPE_CHECKING:
 
 class OrganisationRel(StructuredRel):
     role: str = StringProperty(default="MEMBER")
-    created_at: datetime = DateTimeProperty(default=datetime.utcnow)
-    updated_at: datetime = DateTimeProperty(default=datetime.utcnow)
+    created_at: datetime = DateTimeProperty(default=utcnow)
+    updated_at: datetime = DateTimeProperty(default=utcnow)
 
 
 class User(StructuredNode):
@@ -36,8 +38,8 @@ class User(StructuredNode):
     is_email_verified: bool = BooleanProperty(default=False)
     is_profile_created: bool = BooleanProperty(default=False)
     profile_colour: str = StringProperty()
-    created_at: datetime = DateTimeProperty(default=datetime.utcnow)
-    updated_at: datetime = DateTimeProperty(default=datetime.utcnow)
+    created_at: datetime = DateTimeProperty(default=utcnow)
+    updated_at: datetime = DateTimeProperty(default=utcnow)
 
     # Use string references for relationships
     member_of: Optional["Organisation"] = RelationshipTo(
@@ -60,5 +62,5 @@ class GuideTour(StructuredNode):
     sourcing: bool = BooleanProperty(default=False)
     rfp: bool = BooleanProperty(default=False)
     rfp_template: bool = BooleanProperty(default=False)
-    created_at: datetime = DateTimeProperty(default=datetime.utcnow)
-    updated_at: datetime = DateTimeProperty(default=datetime.utcnow)
+    created_at: datetime = DateTimeProperty(default=utcnow)
+    updated_at: datetime = DateTimeProperty(default=utcnow)
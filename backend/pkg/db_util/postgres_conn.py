@@ -2,6 +2,7 @@ from typing import Dict, Optional, Any, List, Tuple, Union, AsyncGenerator
 from contextlib import asynccontextmanager
 import urllib.parse
 import asyncio
+import orjson
 from pkg.db_util.types import PostgresConfig
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine, async_sessionmaker
 from sqlalchemy.engine.url import URL
@@ -61,6 +62,8 @@ class PostgresConnection:
                     url,
                     echo=False,  # Set to True for debugging SQL
                     # echo_pool="debug", # Set to "debug" for verbose pool logging
+                    # Writes keep SQLAlchemy's default json.dumps; orjson only parses reads
+                    json_deserializer=orjson.loads,
                     **pool_opts
                 )
                 # Optionally, test the connection immediately
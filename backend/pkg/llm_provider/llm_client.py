@@ -324,6 +324,14 @@ class LLMClient:
         embeddings = await self.create_embeddings([text], model)
         return embeddings[0] if embeddings else []
 
+    async def get_embeddings(self, texts: list[str], model: EmbeddingModel = EmbeddingModel.TEXT_EMBEDDING_3_SMALL,
+                             batch_size: int = 64) -> list[list[float]]:
+        """Embed many texts with one API request per batch_size texts, preserving input order"""
+        embeddings: list[list[float]] = []
+        for start in range(0, len(texts), batch_size):
+            embeddings.extend(await self.create_embeddings(texts[start:start + batch_size], model))
+        return embeddings
+
     async def get_response_of_message_list(self, messages: list[dict], model: LLMModel, temperature: float = 0.1,
                                            max_tokens: int = 8000, user_id: Optional[str] = None, response_format: Optional[Any] =None) -> Any:
         # Check token availability if user_id is provided
@@ -32,14 +32,14 @@ class Logger:
 
     def _get_caller_info(self) -> dict[str, Any]:
         """Get caller's filename and line number"""
-        import inspect
-
-        frame = inspect.currentframe()
-        # Get the caller's frame (2 frames up from current frame)
-        caller_frame = frame.f_back.f_back if frame and frame.f_back else None
+        # Get the caller's frame (2 frames up from current frame) without going through inspect
+        try:
+            caller_frame = sys._getframe(2)
+        except ValueError:
+            caller_frame = None
 
         if caller_frame:
-            filename = caller_frame.f_code.co_filename.split("/")[-1]
+            filename = caller_frame.f_code.co_filename.rpartition("/")[2]
             line_no = caller_frame.f_lineno
             return {"filename": filename, "line_no": line_no, "context": ""}
         return {"filename": "unknown", "line_no": 0, "context": ""}
@@ -0,0 +1,6 @@
+from datetime import datetime, timezone
+
+
+def utcnow() -> datetime:
+    """Timezone-aware UTC now, used as the default for neomodel DateTimeProperty fields"""
+    return datetime.now(timezone.utc)